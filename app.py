@@ -9,8 +9,26 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from rewriter import correct_bias
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
+
+def _json_response(payload, status=200):
+    """Build a JSON response via orjson when it is installed.
+
+    Explanation-heavy results dominate the serialization cost of /correct
+    and /batch-correct; errors and small payloads still go through
+    jsonify on the fallback path.
+    """
+    if orjson is not None:
+        return app.response_class(orjson.dumps(payload), status=status,
+                                  mimetype='application/json')
+    return jsonify(payload), status
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -136,7 +154,7 @@ def correct():
     
     try:
         result = correct_bias(text, language)
-        return jsonify(result), 200
+        return _json_response(result)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -154,7 +172,7 @@ def batch_correct():
         try:
             # Read file content
             content = file.read()
-            items = json.loads(content)
+            items = orjson.loads(content) if orjson is not None else json.loads(content)
             
             if not isinstance(items, list):
                 return jsonify({"error": "JSON must be a list of items"}), 400
@@ -180,9 +198,9 @@ def batch_correct():
                             "error": str(e)
                         })
             
-            return jsonify(results), 200
-            
-        except json.JSONDecodeError:
+            return _json_response(results)
+
+        except ValueError:
             return jsonify({"error": "Invalid JSON file"}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
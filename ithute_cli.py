@@ -8,57 +8,117 @@ Command-line interface for the Bias Detection & Rewriting System.
 
 import argparse
 import json
+import multiprocessing
 import sys
 import os
-import time
 from typing import List, Dict, Any
 
 # Ensure we can import from current directory
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from rewriter import correct_bias
-from rule_based_detector import ProgressBar
+from rule_based_detector import ProgressBar, analyze
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this batch size, pool startup costs more than it saves
+_POOL_THRESHOLD = 16
+
+
+def _dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON text, via orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON text, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def process_single_item(text: str, language: str = None) -> Dict[str, Any]:
     """Process a single text item."""
     return correct_bias(text, language)
 
+def _analyze_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze one batch item quietly (no interactive step output).
+    Module-level so multiprocessing workers can pickle it."""
+    text = item.get("text")
+    if not text:
+        return None
+
+    # Handle 'lang' or 'language' keys and normalize language codes
+    lang = item.get("lang") or item.get("language")
+    if lang in ["tn", "st"]:
+        lang = "setswana"
+    elif lang in ["zu", "zulu"]:
+        lang = "isizulu"
+
+    result = analyze(text, lang)
+
+    # Merge result with original item data
+    output_item = item.copy()
+    output_item.update(result)
+    return output_item
+
 def process_batch(items: List[Dict[str, Any]], output_file: str = None):
-    """Process a batch of items with a progress bar."""
-    results = []
+    """Process a batch of items with a progress bar.
+
+    Items are independent, so larger batches are spread across a
+    multiprocessing.Pool; small batches stay serial to avoid pool startup
+    overhead.
+
+    If output_file ends in '.jsonl', results are written one JSON line per
+    item as they arrive instead of being collected into a list first.
+    """
     total = len(items)
     pb = ProgressBar(total, "Processing Batch")
-    
-    for item in items:
-        text = item.get("text")
-        if not text:
-            pb.update()
-            continue
-            
-        # Handle 'lang' or 'language' keys
-        lang = item.get("lang") or item.get("language")
-        result = process_single_item(text, lang)
-        
-        # Merge result with original item data
-        output_item = item.copy()
-        output_item.update(result)
-        results.append(output_item)
-        
-        pb.update()
-        # Small delay to make progress bar visible for small batches
-        time.sleep(0.05)
-        
+
+    def iter_results():
+        if total >= _POOL_THRESHOLD:
+            with multiprocessing.Pool() as pool:
+                for output_item in pool.imap(_analyze_item, items, chunksize=16):
+                    pb.update()
+                    if output_item is not None:
+                        yield output_item
+        else:
+            for item in items:
+                output_item = _analyze_item(item)
+                pb.update()
+                if output_item is not None:
+                    yield output_item
+
+    if output_file and output_file.endswith(".jsonl"):
+        # Stream one JSON line per item so memory stays flat regardless of
+        # batch size; the full results list is never materialized.
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                for output_item in iter_results():
+                    f.write(_dumps(output_item, indent=False) + "\n")
+            pb.complete()
+            print(f"\nResults saved to {output_file}")
+        except Exception as e:
+            print(f"\nError saving output: {e}")
+        return
+
+    results = list(iter_results())
     pb.complete()
-    
+
     if output_file:
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+                f.write(_dumps(results))
             print(f"\nResults saved to {output_file}")
         except Exception as e:
             print(f"\nError saving output: {e}")
     else:
-        print(json.dumps(results, indent=2, ensure_ascii=False))
+        print(_dumps(results))
 
 def main():
     parser = argparse.ArgumentParser(description="Ithute AI Bridge - Bias Detection & Rewriting CLI")
@@ -79,12 +139,12 @@ def main():
         if args.text:
             # Single text mode
             result = process_single_item(args.text)
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(_dumps(result))
             
         elif args.json:
             # JSON string mode
             try:
-                data = json.loads(args.json)
+                data = _loads(args.json)
                 text = data.get("text")
                 if not text:
                     print("Error: JSON must contain 'text' field.")
@@ -97,8 +157,8 @@ def main():
                 # Merge with input data to preserve ID etc
                 output = data.copy()
                 output.update(result)
-                print(json.dumps(output, indent=2, ensure_ascii=False))
-            except json.JSONDecodeError:
+                print(_dumps(output))
+            except ValueError:
                 print("Error: Invalid JSON string.")
                 sys.exit(1)
                 
@@ -109,8 +169,8 @@ def main():
                 sys.exit(1)
                 
             try:
-                with open(args.file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(args.file, 'rb') as f:
+                    data = _loads(f.read())
                 
                 if isinstance(data, list):
                     process_batch(data, args.output)
@@ -122,13 +182,13 @@ def main():
                         result = process_single_item(text, lang)
                         output = data.copy()
                         output.update(result)
-                        print(json.dumps(output, indent=2, ensure_ascii=False))
+                        print(_dumps(output))
                     else:
                         print("Error: JSON object must contain 'text' field.")
                 else:
                     print("Error: JSON file must contain a list or an object.")
                     
-            except json.JSONDecodeError:
+            except ValueError:
                 print("Error: Invalid JSON file.")
                 sys.exit(1)
             except Exception as e:
@@ -43,8 +43,18 @@ FALLBACK_DATA = [
     }
 ]
 
-# Load ground truth from JSON file
-GROUND_TRUTH_DATA = load_ground_truth()
+# Ground truth is loaded lazily on first use (see __getattr__ below) so
+# that importing this module — e.g. in CLI startup or pool workers — does
+# not pay for reading and parsing ground_truth.json until something
+# actually retrieves examples.
+_GROUND_TRUTH_DATA = None
+
+def _ground_truth():
+    """Load and memoize the ground truth examples."""
+    global _GROUND_TRUTH_DATA
+    if _GROUND_TRUTH_DATA is None:
+        _GROUND_TRUTH_DATA = load_ground_truth()
+    return _GROUND_TRUTH_DATA
 
 # --- Custom Lexicons for Bias Detection ---
 
@@ -117,43 +127,54 @@ BIAS_PATTERNS = {
     ]
 }
 
-# Bias categories mapping (updated for all categories in ground truth)
-BIAS_CATEGORIES = {
-    "Occupational & Role Stereotyping": {
-        "keywords": [
-            # Setswana occupational and role terms
-            "motshameki", "morutišana", "motlhankedi", "thotse", "selepe", "motho", "manamagadi",
-            "mma seapei", "mosala gae", "poo", "lesaka", "dinke", "mabogo",
-            # Zulu occupational and academic terms
-            "ubunjiniyela", "ifisiksi", "ezobuciko", "isayensi", "ikhompyutha", 
-            "ezemidlalo", "ezomnotho", "ukufunda", "bangcono", "akufanele",
-            # Common phrases
-            "monna", "mosadi", "amakhwenkwe", "abesilisa", "abesifazane", "amantombazane"
-        ],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Occupational & Role Stereotyping"]
-    },
-    "Gender": {
-        "keywords": ["mosetsana", "mosimane", "intombazane", "umfana"],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Gender"]
-    },
-    "Gendered Wording": {
-        "keywords": ["segametsi", "mme", "mmagwana", "motsadi", "ga a nyala mosadi", "owesifazane", "owesilisa"],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Gendered Wording"]
-    },
-    "Stereotypical Pronominalization": {
-        "keywords": ["khumoetsile", "kgosietsile", "lerapo", "lobola", "lerapo", "magadi"],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Stereotypical Pronominalization"]
-    },
-    "Honorific & Title Asymmetry": {
-        "keywords": ["rra-", "mma-", "u-mnumzane", "u-nkosikazi"],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Honorific & Title Asymmetry"]
-    },
-    "Semantic Derogation": {
-        "keywords": ["isiwula", "isigebengu", "mbumbulu", "ohlwempu", "ubunuku"],
-        "examples": [ex for ex in GROUND_TRUTH_DATA if ex["bias_category"] == "Semantic Derogation"]
-    }
+# Bias categories mapping (updated for all categories in ground truth).
+# Keywords are static; the per-category examples come from the lazily
+# loaded ground truth, so the full BIAS_CATEGORIES dict is also built on
+# first access rather than at import.
+_CATEGORY_KEYWORDS = {
+    "Occupational & Role Stereotyping": [
+        # Setswana occupational and role terms
+        "motshameki", "morutišana", "motlhankedi", "thotse", "selepe", "motho", "manamagadi",
+        "mma seapei", "mosala gae", "poo", "lesaka", "dinke", "mabogo",
+        # Zulu occupational and academic terms
+        "ubunjiniyela", "ifisiksi", "ezobuciko", "isayensi", "ikhompyutha",
+        "ezemidlalo", "ezomnotho", "ukufunda", "bangcono", "akufanele",
+        # Common phrases
+        "monna", "mosadi", "amakhwenkwe", "abesilisa", "abesifazane", "amantombazane"
+    ],
+    "Gender": ["mosetsana", "mosimane", "intombazane", "umfana"],
+    "Gendered Wording": ["segametsi", "mme", "mmagwana", "motsadi", "ga a nyala mosadi", "owesifazane", "owesilisa"],
+    "Stereotypical Pronominalization": ["khumoetsile", "kgosietsile", "lerapo", "lobola", "lerapo", "magadi"],
+    "Honorific & Title Asymmetry": ["rra-", "mma-", "u-mnumzane", "u-nkosikazi"],
+    "Semantic Derogation": ["isiwula", "isigebengu", "mbumbulu", "ohlwempu", "ubunuku"],
 }
 
+_BIAS_CATEGORIES = None
+
+def _bias_categories():
+    """Build and memoize the category -> keywords/examples mapping."""
+    global _BIAS_CATEGORIES
+    if _BIAS_CATEGORIES is None:
+        # Bucket the ground truth in one pass instead of filtering the
+        # full list once per category
+        by_category = {}
+        for ex in _ground_truth():
+            by_category.setdefault(ex["bias_category"], []).append(ex)
+        _BIAS_CATEGORIES = {
+            name: {"keywords": keywords, "examples": by_category.get(name, [])}
+            for name, keywords in _CATEGORY_KEYWORDS.items()
+        }
+    return _BIAS_CATEGORIES
+
+def __getattr__(name):
+    # PEP 562: keep `rag_data.GROUND_TRUTH_DATA` and `rag_data.BIAS_CATEGORIES`
+    # working as module attributes without paying the JSON load at import time.
+    if name == "GROUND_TRUTH_DATA":
+        return _ground_truth()
+    if name == "BIAS_CATEGORIES":
+        return _bias_categories()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def retrieve_examples(category, k=2):
     """
     Retrieves 'k' examples from ground truth for a specific category.
@@ -162,7 +183,7 @@ def retrieve_examples(category, k=2):
     examples = []
     
     # Try to get examples from the specific category
-    for entry in GROUND_TRUTH_DATA:
+    for entry in _ground_truth():
         if entry.get('bias_category') == category:
             examples.append({
                 "biased": entry['biased_text'],
@@ -173,7 +194,7 @@ def retrieve_examples(category, k=2):
     
     # Fallback: get any examples if category doesn't match
     if not examples:
-        for entry in GROUND_TRUTH_DATA[:k]:
+        for entry in _ground_truth()[:k]:
             examples.append({
                 "biased": entry['biased_text'],
                 "corrected": entry['bias_free_text']
@@ -187,9 +208,10 @@ def get_category_from_text(text):
     """
     text_lower = text.lower()
     
-    # Check keywords for each category
-    for category, data in BIAS_CATEGORIES.items():
-        for keyword in data["keywords"]:
+    # Check keywords for each category; keywords are static, so this
+    # never needs the ground-truth examples loaded
+    for category, keywords in _CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
             if keyword in text_lower:
                 return category
     
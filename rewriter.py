@@ -23,6 +23,18 @@ from rule_based_detector import (
     find_stereotyped_actions,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """Pretty-print a result as JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
 
 def correct_bias(text, language=None):
     """
@@ -128,7 +140,7 @@ def run_interactive():
         
         # Print JSON output
         print("\n📄 JSON Output:")
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        print(_dumps(result))
         print("\n")
 
 
@@ -159,7 +171,7 @@ if __name__ == "__main__":
         if len(sys.argv) > 2:
             text = " ".join(sys.argv[2:])
             result = analyze(text)
-            print(json.dumps(result, ensure_ascii=False, indent=2))
+            print(_dumps(result))
         else:
             print("Usage: python rewriter.py json <text>")
     
@@ -7,6 +7,7 @@ Focus on rewriting metrics: similarity, context preservation, and fluency.
 """
 
 import csv
+import hashlib
 import json
 import sys
 import io
@@ -28,6 +29,13 @@ if sys.platform == 'win32':
 from rewriter import correct_bias
 from rule_based_detector import ProgressBar
 
+# orjson is much faster for the large nested result lists; fall back to
+# stdlib json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # ENHANCED REWRITING QUALITY METRICS
 # =============================================================================
@@ -39,20 +47,26 @@ def semantic_similarity(text1: str, text2: str) -> float:
     """
     if not text1 or not text2:
         return 0.0
-    
+    lower1, lower2 = text1.lower(), text2.lower()
+    return _semantic_similarity(lower1, lower2, lower1.split(), lower2.split())
+
+
+def _semantic_similarity(lower1: str, lower2: str,
+                         words1: List[str], words2: List[str]) -> float:
+    """Core of semantic_similarity operating on pre-lowered/split text."""
     # Character-level similarity (SequenceMatcher)
-    char_sim = SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-    
+    char_sim = SequenceMatcher(None, lower1, lower2).ratio()
+
     # Word-level similarity (Jaccard)
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
-    if words1 and words2:
-        intersection = words1 & words2
-        union = words1 | words2
+    set1 = set(words1)
+    set2 = set(words2)
+    if set1 and set2:
+        intersection = set1 & set2
+        union = set1 | set2
         word_sim = len(intersection) / len(union)
     else:
         word_sim = 0.0
-    
+
     # Weighted combination (60% character, 40% word)
     combined = (char_sim * 0.6) + (word_sim * 0.4)
     return combined * 100
@@ -65,13 +79,14 @@ def context_preservation_score(original: str, rewritten: str) -> float:
     """
     if not original or not rewritten:
         return 0.0
-    
-    orig_words = original.lower().split()
-    rewrite_words = rewritten.lower().split()
-    
+    return _context_preservation(original.lower().split(), rewritten.lower().split())
+
+
+def _context_preservation(orig_words: List[str], rewrite_words: List[str]) -> float:
+    """Core of context_preservation_score operating on pre-split words."""
     if not orig_words:
         return 0.0
-    
+
     # Define gendered terms to exclude from retention calculation
     gendered_terms = {
         'mosadi', 'monna', 'mosetsana', 'mosimane', 'basadi', 'banna',
@@ -107,16 +122,18 @@ def gender_neutralization_score(original: str, rewritten: str) -> float:
     Measure effectiveness of gender neutralization (0-100).
     Higher score = more effective removal of gendered language.
     """
+    return _gender_neutralization(original.lower(), rewritten.lower())
+
+
+def _gender_neutralization(orig_lower: str, rewrite_lower: str) -> float:
+    """Core of gender_neutralization_score operating on pre-lowered text."""
     gendered_terms = [
         'mosadi', 'monna', 'mosetsana', 'mosimane', 'basadi', 'banna',
         'umama', 'ubaba', 'umfazi', 'indoda', 'intombazane', 'umfana',
         'abesifazane', 'abesilisa', 'amantombazane', 'amakhwenkwe',
         'ngwanyana', 'moshemane', 'bomma', 'borra'
     ]
-    
-    orig_lower = original.lower()
-    rewrite_lower = rewritten.lower()
-    
+
     # Count gendered terms in original and rewrite
     orig_count = sum(1 for term in gendered_terms if term in orig_lower)
     rewrite_count = sum(1 for term in gendered_terms if term in rewrite_lower)
@@ -137,42 +154,79 @@ def fluency_score(original: str, rewritten: str) -> float:
     """
     if not original or not rewritten:
         return 0.0
-    
-    orig_words = original.split()
-    rewrite_words = rewritten.split()
-    
+    return _fluency(original.lower().split(), rewritten.lower().split())
+
+
+def _fluency(orig_words: List[str], rewrite_words: List[str]) -> float:
+    """Core of fluency_score operating on pre-split words."""
     # Length appropriateness (rewrites shouldn't be drastically different in length)
     len_ratio = min(len(rewrite_words), len(orig_words)) / max(len(rewrite_words), len(orig_words))
-    
+
     # Penalize very short rewrites (likely incomplete)
     if len(rewrite_words) < 3:
         length_penalty = 0.5
     else:
         length_penalty = 1.0
-    
+
     # Basic structural integrity (has some common words)
-    common_words = set(original.lower().split()) & set(rewritten.lower().split())
+    common_words = set(orig_words) & set(rewrite_words)
     structure_score = min(1.0, len(common_words) / max(1, len(orig_words) * 0.3))
-    
+
     # Weighted combination
     score = (len_ratio * 0.4) + (structure_score * 0.6)
     return score * length_penalty * 100
 
 
+# Cache of computed metrics keyed by a digest of the (original, rewritten) pair.
+# Bias datasets often repeat the same sentence under multiple bias_type labels,
+# so identical pairs are common and the SequenceMatcher work can be skipped.
+_QUALITY_CACHE: Dict[bytes, Dict[str, float]] = {}
+_QUALITY_CACHE_MAX = 50000
+_quality_cache_stats = {"lookups": 0, "hits": 0}
+
+
+def quality_cache_hit_rate() -> float:
+    """Return the cache hit rate (0-100) for quality metric lookups."""
+    lookups = _quality_cache_stats["lookups"]
+    return (_quality_cache_stats["hits"] / lookups * 100) if lookups else 0.0
+
+
 def overall_rewriting_quality(original: str, rewritten: str) -> Dict[str, float]:
     """
     Calculate all rewriting quality metrics and overall score.
     Returns dict with individual metrics and weighted overall score.
+    Results are cached per (original, rewritten) pair since duplicated
+    sentences are common in the bias datasets.
     """
-    semantic = semantic_similarity(original, rewritten)
-    context = context_preservation_score(original, rewritten)
-    gender = gender_neutralization_score(original, rewritten)
-    fluency = fluency_score(original, rewritten)
+    key = hashlib.blake2b(
+        original.encode('utf-8') + b'\x00' + rewritten.encode('utf-8')
+    ).digest()
+
+    _quality_cache_stats["lookups"] += 1
+    cached = _QUALITY_CACHE.get(key)
+    if cached is not None:
+        _quality_cache_stats["hits"] += 1
+        return dict(cached)
+
+    # Lowercase and split each text once and share the result across all
+    # four metrics instead of re-tokenizing per metric.
+    orig_lower = original.lower()
+    rew_lower = rewritten.lower()
+    orig_words = orig_lower.split()
+    rew_words = rew_lower.split()
+
+    if original and rewritten:
+        semantic = _semantic_similarity(orig_lower, rew_lower, orig_words, rew_words)
+        context = _context_preservation(orig_words, rew_words)
+        fluency = _fluency(orig_words, rew_words)
+    else:
+        semantic = context = fluency = 0.0
+    gender = _gender_neutralization(orig_lower, rew_lower)
     
     # Weighted overall score (as per implementation plan)
     overall = (semantic * 0.40) + (context * 0.30) + (gender * 0.20) + (fluency * 0.10)
-    
-    return {
+
+    metrics = {
         "semantic_similarity": round(semantic, 2),
         "context_preservation": round(context, 2),
         "gender_neutralization": round(gender, 2),
@@ -180,6 +234,11 @@ def overall_rewriting_quality(original: str, rewritten: str) -> Dict[str, float]
         "overall_quality": round(overall, 2)
     }
 
+    if len(_QUALITY_CACHE) < _QUALITY_CACHE_MAX:
+        _QUALITY_CACHE[key] = metrics
+
+    return dict(metrics)
+
 
 # =============================================================================
 # DATA LOADING
@@ -258,31 +317,24 @@ def load_csv_dataset(filepath: str, language: str, sample_size: int = None) -> L
 # EVALUATION
 # =============================================================================
 
-def evaluate_single(item: Dict) -> Dict:
+def _evaluate_text(text: str, language: str) -> Dict:
     """
-    Evaluate a single item for detection and rewriting quality.
+    Run bias correction and quality metrics for one (text, language) pair.
+    Returns only the detection/rewriting fields shared by all items with
+    the same text.
     """
-    text = item["text"]
-    language = item["language"]
-    
     # Run bias correction
     result = correct_bias(text, language)
-    
+
     # Extract results
     has_bias = result.get("has_bias", False)
     rewrite = result.get("rewrite", text)
     explanations = result.get("explanations", [])
-    
+
     # Calculate rewriting quality metrics
     quality_metrics = overall_rewriting_quality(text, rewrite)
-    
-    # Compile evaluation result
-    eval_result = {
-        "text": text,
-        "english": item["english"],
-        "bias_type": item["bias_type"],
-        "discipline": item["discipline"],
-        "language": item["language"],
+
+    return {
         "detected_bias": has_bias,
         "num_rules_triggered": len(explanations),
         "rules_triggered": [e.get("rule_triggered", "") for e in explanations],
@@ -290,8 +342,22 @@ def evaluate_single(item: Dict) -> Dict:
         "text_modified": rewrite.lower() != text.lower(),
         **quality_metrics
     }
-    
-    return eval_result
+
+
+def evaluate_single(item: Dict) -> Dict:
+    """
+    Evaluate a single item for detection and rewriting quality.
+    """
+    shared = _evaluate_text(item["text"], item["language"])
+
+    return {
+        "text": item["text"],
+        "english": item["english"],
+        "bias_type": item["bias_type"],
+        "discipline": item["discipline"],
+        "language": item["language"],
+        **shared
+    }
 
 
 def run_evaluation(setswana_path: str, zulu_path: str, sample_size: int = 250) -> Dict:
@@ -325,62 +391,112 @@ def run_evaluation(setswana_path: str, zulu_path: str, sample_size: int = 250) -
     if len(bias_types) > 10:
         print(f"      ... and {len(bias_types) - 10} more")
     
-    # Run evaluation
+    # Run evaluation. The same sentence often appears under multiple
+    # bias_type labels, so bucket items by (text, language), evaluate each
+    # unique pair once, and fan the shared output back out to every row.
     print("\n[2] Running evaluation...")
-    progress = ProgressBar(len(all_items), "Evaluating")
-    
-    results = []
-    for item in all_items:
-        result = evaluate_single(item)
-        results.append(result)
+
+    unique = {}
+    for idx, item in enumerate(all_items):
+        unique.setdefault((item["text"], item["language"]), []).append(idx)
+
+    print(f"    Unique (text, language) pairs: {len(unique)}/{len(all_items)}")
+
+    progress = ProgressBar(len(unique), "Evaluating")
+
+    results = [None] * len(all_items)
+    for (text, language), indices in unique.items():
+        shared = _evaluate_text(text, language)
+        for idx in indices:
+            item = all_items[idx]
+            results[idx] = {
+                "text": text,
+                "english": item["english"],
+                "bias_type": item["bias_type"],
+                "discipline": item["discipline"],
+                "language": language,
+                **shared
+            }
         progress.update()
-    
+
     progress.complete()
-    
+
+    print(f"    Quality cache hit rate: {quality_cache_hit_rate():.1f}%")
+
     # Calculate aggregate metrics
     print("\n[3] Calculating aggregate metrics...")
     
     total = len(results)
-    detected = sum(1 for r in results if r["detected_bias"])
-    modified = sum(1 for r in results if r["text_modified"])
-    
+
+    # Accumulate counts and metric sums in a single pass over the results
+    # instead of one comprehension scan per statistic. Per-group running
+    # sums (language, bias type, discipline) are gathered in the same pass
+    # rather than storing full result dicts per group and re-scanning them.
+    detected = modified = 0
+    sum_semantic = sum_context = sum_gender = sum_fluency = sum_overall = 0.0
+    # label -> [count, detected, sum_overall, sum_semantic, sum_context]
+    lang_acc = {}
+    bias_acc = {}
+    # discipline -> [count, detected, sum_overall]
+    disc_acc = {}
+    for r in results:
+        is_detected = r["detected_bias"]
+        overall_q = r["overall_quality"]
+        semantic_q = r["semantic_similarity"]
+        context_q = r["context_preservation"]
+
+        if is_detected:
+            detected += 1
+        if r["text_modified"]:
+            modified += 1
+        sum_semantic += semantic_q
+        sum_context += context_q
+        sum_gender += r["gender_neutralization"]
+        sum_fluency += r["fluency"]
+        sum_overall += overall_q
+
+        for acc, label in ((lang_acc, r["language"]), (bias_acc, r["bias_type"])):
+            group = acc.setdefault(label, [0, 0, 0.0, 0.0, 0.0])
+            group[0] += 1
+            group[1] += is_detected
+            group[2] += overall_q
+            group[3] += semantic_q
+            group[4] += context_q
+
+        disc = disc_acc.setdefault(r["discipline"], [0, 0, 0.0])
+        disc[0] += 1
+        disc[1] += is_detected
+        disc[2] += overall_q
+
     # Overall metrics
-    avg_semantic = sum(r["semantic_similarity"] for r in results) / total
-    avg_context = sum(r["context_preservation"] for r in results) / total
-    avg_gender = sum(r["gender_neutralization"] for r in results) / total
-    avg_fluency = sum(r["fluency"] for r in results) / total
-    avg_overall = sum(r["overall_quality"] for r in results) / total
+    avg_semantic = sum_semantic / total
+    avg_context = sum_context / total
+    avg_gender = sum_gender / total
+    avg_fluency = sum_fluency / total
+    avg_overall = sum_overall / total
     
     # By language
-    tn_results = [r for r in results if r["language"] == "tn"]
-    zu_results = [r for r in results if r["language"] == "zu"]
-    
+    tn_acc = lang_acc.get("tn", [0, 0, 0.0, 0.0, 0.0])
+    zu_acc = lang_acc.get("zu", [0, 0, 0.0, 0.0, 0.0])
+
     # By bias type
-    by_bias_type = defaultdict(list)
-    for r in results:
-        by_bias_type[r["bias_type"]].append(r)
-    
     bias_type_metrics = {}
-    for bias_type, type_results in by_bias_type.items():
+    for bias_type, (count, type_detected, type_overall, type_semantic, type_context) in bias_acc.items():
         bias_type_metrics[bias_type] = {
-            "count": len(type_results),
-            "detection_rate": sum(1 for r in type_results if r["detected_bias"]) / len(type_results) * 100,
-            "avg_overall_quality": sum(r["overall_quality"] for r in type_results) / len(type_results),
-            "avg_semantic_similarity": sum(r["semantic_similarity"] for r in type_results) / len(type_results),
-            "avg_context_preservation": sum(r["context_preservation"] for r in type_results) / len(type_results)
+            "count": count,
+            "detection_rate": type_detected / count * 100,
+            "avg_overall_quality": type_overall / count,
+            "avg_semantic_similarity": type_semantic / count,
+            "avg_context_preservation": type_context / count
         }
-    
+
     # By discipline
-    by_discipline = defaultdict(list)
-    for r in results:
-        by_discipline[r["discipline"]].append(r)
-    
     discipline_metrics = {}
-    for discipline, disc_results in by_discipline.items():
+    for discipline, (count, disc_detected, disc_overall) in disc_acc.items():
         discipline_metrics[discipline] = {
-            "count": len(disc_results),
-            "detection_rate": sum(1 for r in disc_results if r["detected_bias"]) / len(disc_results) * 100,
-            "avg_overall_quality": sum(r["overall_quality"] for r in disc_results) / len(disc_results)
+            "count": count,
+            "detection_rate": disc_detected / count * 100,
+            "avg_overall_quality": disc_overall / count
         }
     
     # Compile summary
@@ -399,18 +515,18 @@ def run_evaluation(setswana_path: str, zulu_path: str, sample_size: int = 250) -
         # By language
         "by_language": {
             "setswana": {
-                "count": len(tn_results),
-                "detection_rate": sum(1 for r in tn_results if r["detected_bias"]) / len(tn_results) * 100 if tn_results else 0,
-                "avg_overall_quality": sum(r["overall_quality"] for r in tn_results) / len(tn_results) if tn_results else 0,
-                "avg_semantic_similarity": sum(r["semantic_similarity"] for r in tn_results) / len(tn_results) if tn_results else 0,
-                "avg_context_preservation": sum(r["context_preservation"] for r in tn_results) / len(tn_results) if tn_results else 0
+                "count": tn_acc[0],
+                "detection_rate": tn_acc[1] / tn_acc[0] * 100 if tn_acc[0] else 0,
+                "avg_overall_quality": tn_acc[2] / tn_acc[0] if tn_acc[0] else 0,
+                "avg_semantic_similarity": tn_acc[3] / tn_acc[0] if tn_acc[0] else 0,
+                "avg_context_preservation": tn_acc[4] / tn_acc[0] if tn_acc[0] else 0
             },
             "isizulu": {
-                "count": len(zu_results),
-                "detection_rate": sum(1 for r in zu_results if r["detected_bias"]) / len(zu_results) * 100 if zu_results else 0,
-                "avg_overall_quality": sum(r["overall_quality"] for r in zu_results) / len(zu_results) if zu_results else 0,
-                "avg_semantic_similarity": sum(r["semantic_similarity"] for r in zu_results) / len(zu_results) if zu_results else 0,
-                "avg_context_preservation": sum(r["context_preservation"] for r in zu_results) / len(zu_results) if zu_results else 0
+                "count": zu_acc[0],
+                "detection_rate": zu_acc[1] / zu_acc[0] * 100 if zu_acc[0] else 0,
+                "avg_overall_quality": zu_acc[2] / zu_acc[0] if zu_acc[0] else 0,
+                "avg_semantic_similarity": zu_acc[3] / zu_acc[0] if zu_acc[0] else 0,
+                "avg_context_preservation": zu_acc[4] / zu_acc[0] if zu_acc[0] else 0
             }
         },
         
@@ -474,8 +590,13 @@ def print_summary_report(eval_data: Dict):
 
 def save_results(eval_data: Dict, output_path: str):
     """Save evaluation results to JSON."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(eval_data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly (no ensure_ascii needed)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(eval_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(eval_data, f, ensure_ascii=False, indent=2)
     print(f"\n✓ Results saved to: {output_path}")
 
 
@@ -490,15 +611,22 @@ def save_results_csv(eval_data: Dict, output_path: str):
             "semantic_similarity", "context_preservation", "gender_neutralization",
             "fluency", "overall_quality"
         ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+
+        # Plain csv.writer with an unrolled row list avoids the per-row dict
+        # rebuild that DictWriter does internally.
         for r in results:
-            row = {k: r.get(k, "") for k in fieldnames}
-            # Convert lists to strings
-            if isinstance(row.get("rules_triggered"), list):
-                row["rules_triggered"] = "; ".join(row["rules_triggered"])
-            writer.writerow(row)
+            get = r.get
+            writer.writerow([
+                get("text", ""), get("english", ""), get("bias_type", ""),
+                get("discipline", ""), get("language", ""),
+                get("detected_bias", ""), get("num_rules_triggered", ""),
+                get("rewrite", ""), get("text_modified", ""),
+                get("semantic_similarity", ""), get("context_preservation", ""),
+                get("gender_neutralization", ""), get("fluency", ""),
+                get("overall_quality", "")
+            ])
     
     print(f"✓ CSV results saved to: {output_path}")
 
@@ -9,10 +9,13 @@ No LLM dependency - purely lexicon and rule-based.
 Includes progress bar and batch processing support.
 """
 
+import bisect
+import multiprocessing
 import re
 import json
 import sys
 import time
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 import rag_data  # Import the centralized data module
 
@@ -29,6 +32,10 @@ class ProgressBar:
         self.description = description
         self.width = width
         self.start_time = time.time()
+        self._last_draw = 0.0
+        # Carriage-return animation is only meaningful on a terminal;
+        # redirected output skips the bar (and its syscalls) entirely
+        self._enabled = sys.stdout.isatty()
     
     def update(self, step: int = 1):
         """Update progress by step amount."""
@@ -42,11 +49,21 @@ class ProgressBar:
     
     def _display(self):
         """Display the progress bar."""
+        if not self._enabled:
+            return
+
+        # Throttle redraws to ~30 Hz; terminal writes otherwise dominate
+        # tight batch loops. The final update always draws.
+        now = time.monotonic()
+        if self.current < self.total and now - self._last_draw < 0.033:
+            return
+        self._last_draw = now
+
         if self.total == 0:
             percent = 100
         else:
             percent = min(100, (self.current / self.total) * 100)
-        
+
         filled = int(self.width * percent / 100)
         bar = "█" * filled + "░" * (self.width - filled)
         
@@ -184,6 +201,54 @@ STEREOTYPED_ACTIONS = {
     }
 }
 
+def _trie_pattern(words) -> str:
+    """Build a trie-factored regex fragment matching any of `words`.
+
+    A flat alternation (w1|w2|...|wN) makes the regex engine try every
+    branch at each position; factoring shared prefixes into a trie shape
+    ('bala(?: buka)?') keeps the live branches proportional to the word
+    length instead of the vocabulary size. Greedy optional suffixes
+    preserve longest-match preference, same as a longest-first alternation.
+    """
+    trie: Dict[str, Any] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def emit(node) -> str:
+        optional = '' in node
+        alts = [re.escape(ch) + emit(child)
+                for ch, child in sorted(node.items()) if ch != '']
+        if not alts:
+            return ''
+        if len(alts) == 1 and not optional:
+            return alts[0]
+        fragment = '(?:' + '|'.join(alts) + ')'
+        if optional:
+            fragment += '?'
+        return fragment
+
+    return emit(trie)
+
+
+# One action alternation per language so find_stereotyped_actions scans the
+# text once rather than once per phrase. Trie-factored, so compound
+# phrases ("apea dijo") win over their own prefixes ("apea").
+_ACTION_CATEGORY: Dict[str, Dict[str, str]] = {}
+for _category, _lang_actions in STEREOTYPED_ACTIONS.items():
+    for _lang, _phrases in _lang_actions.items():
+        for _phrase in _phrases:
+            _ACTION_CATEGORY.setdefault(_lang, {})[_phrase] = _category
+_ACTION_RE = {
+    lang: re.compile(
+        r'\b' + _trie_pattern(phrases) + r'\b'
+    )
+    for lang, phrases in _ACTION_CATEGORY.items()
+}
+del _category, _lang_actions, _lang, _phrases, _phrase
+
 # D. Occupations commonly gender-coded
 # Merging with rag_data.OCCUPATIONAL_TERMS
 OCCUPATIONS = {
@@ -240,6 +305,67 @@ OCCUPATIONS = {
     }
 }
 
+# One alternation per language so rule_3 scans the text once instead of once
+# per gendered form. The lookahead keeps overlapping occurrences visible, which
+# matches the old per-key substring tests.
+_GENDERED_FORM_RE = {
+    lang: re.compile(
+        r'(?=(' + _trie_pattern(occ.get("gendered_forms", {})) + r'))'
+    )
+    for lang, occ in OCCUPATIONS.items()
+    if occ.get("gendered_forms")
+}
+
+# First characters of the gendered forms above. Testing these against the
+# text is a near-free way to skip the regex scan on the common no-match path.
+_RULE3_FIRST = {
+    lang: frozenset(k[0] for k in occ.get("gendered_forms", {}))
+    for lang, occ in OCCUPATIONS.items()
+    if occ.get("gendered_forms")
+}
+
+# Common names associated with stereotypes in the dataset (rule_9)
+_BIASED_NAMES = {
+    "thandi": "female",
+    "lerato": "female",
+    "palesa": "female",
+    "thabo": "male",
+    "mpho": "male",
+    "kabelo": "male"
+}
+_BIASED_NAMES_RE = re.compile(_trie_pattern(_BIASED_NAMES))
+
+# Combined replacement patterns so the rewrite templates substitute every
+# gendered term in one pass instead of one re.sub per dictionary key.
+_ALL_GENDERED = {
+    lang: {**nouns.get("male", {}), **nouns.get("female", {})}
+    for lang, nouns in GENDERED_NOUNS.items()
+}
+_NEUTRAL_SUB_RE = {
+    lang: re.compile(
+        r'\b(' + _trie_pattern(words) + r')\b',
+        re.IGNORECASE)
+    for lang, words in _ALL_GENDERED.items()
+}
+# Per-word patterns for template_e, which replaces only the first gendered
+# word (in lexicon order) found in the text
+_GENDERED_WORD_RES = {
+    lang: {w: re.compile(r'\b' + re.escape(w) + r'\b', re.IGNORECASE) for w in words}
+    for lang, words in _ALL_GENDERED.items()
+}
+_OCC_SUB_RE = {
+    lang: re.compile(
+        r'\b(' + _trie_pattern(occ["gendered_forms"]) + r')\b',
+        re.IGNORECASE)
+    for lang, occ in OCCUPATIONS.items()
+    if occ.get("gendered_forms")
+}
+_OCC_SUB_MAP = {
+    lang: {gendered.lower(): neutral for gendered, neutral in occ["gendered_forms"].items()}
+    for lang, occ in OCCUPATIONS.items()
+    if occ.get("gendered_forms")
+}
+
 # E. Pejorative Terms
 # Merging with rag_data.PEJORATIVE_TERMS
 PEJORATIVE_TERMS = rag_data.PEJORATIVE_TERMS
@@ -262,12 +388,26 @@ GENERALIZATION_MARKERS = {
     "isizulu": ["njalo", "ngaso sonke isikhathi", "abakwazi", "ngokwemvelo", "kuphela", "bonke"],
 }
 
+# One compiled word-boundary pattern per generalization marker (rule_4)
+_GEN_MARKER_RES = {
+    lang: tuple((marker, re.compile(r'\b' + re.escape(marker) + r'\b'))
+                for marker in markers)
+    for lang, markers in GENERALIZATION_MARKERS.items()
+}
+
 # Contrastive conjunctions (for Rule 2)
 CONTRASTIVE_CONJUNCTIONS = {
     "setswana": ["fa", "le fa", "mme", "fela"],
     "isizulu": ["uma", "kanti", "kodwa", "ngesikhathi"],
 }
 
+# One compiled alternation per language; rule_2 can bail out with a single
+# search when no contrastive conjunction is present at all
+_CONJ_RE = {
+    lang: re.compile(r'\b' + _trie_pattern(conjs) + r'\b')
+    for lang, conjs in CONTRASTIVE_CONJUNCTIONS.items()
+}
+
 # Infantilizing/diminutive patterns
 INFANTILIZING_PATTERNS = {
     "setswana": [
@@ -280,6 +420,33 @@ INFANTILIZING_PATTERNS = {
     ],
 }
 
+# Compiled once at import so batch runs don't recompile per document
+_COMPILED_INFANTILIZING = {
+    lang: [re.compile(p) for p in patterns]
+    for lang, patterns in INFANTILIZING_PATTERNS.items()
+}
+
+# Capability-assumption patterns for rule_11, compiled once at import
+_CAPABILITY_RES = [
+    re.compile(p) for p in rag_data.BIAS_PATTERNS.get("capability_assumptions", [])
+]
+
+# One ignore-case alternation per language for stripping pejoratives from a
+# rewrite, replacing one re.sub per pejorative term
+_PEJ_REMOVE_RE = {
+    lang: re.compile(
+        r'\b' + _trie_pattern(terms) + r'\b',
+        re.IGNORECASE,
+    )
+    for lang, terms in PEJORATIVE_TERMS.items()
+    if terms
+}
+
+# Pluralization substitutions for template_d
+_PLURAL_TN_OA_RE = re.compile(r'\bo\s+a\s+')
+_PLURAL_TN_O_RE = re.compile(r'\bo\s+')
+_PLURAL_ZU_U_RE = re.compile(r'\bu\s+')
+
 # =============================================================================
 # SECTION 2: PREPROCESSING
 # =============================================================================
@@ -296,262 +463,390 @@ PREFIXES = {
 }
 
 
+_WORD_RE = re.compile(r'\w+')
+_TOK_RE = re.compile(r'\b\w+\b|[.,!?;:]')
+
+
 def tokenize(text: str) -> List[str]:
     """Tokenize text into words."""
-    tokens = re.findall(r'\b\w+\b|[.,!?;:]', text)
-    return tokens
+    return _TOK_RE.findall(text)
 
 
-def identify_prefix(token: str, language: str) -> Tuple[Optional[str], str]:
-    """Identify noun-class or verb prefix in a token."""
-    token_lower = token.lower()
+def _build_prefix_trie(language: str) -> Dict[str, Any]:
+    """Build a character trie over all prefixes for one language."""
     prefixes = PREFIXES.get(language, {})
-    
-    # Combined list of all prefixes, sorted by length descending to match longest first
     all_prefixes = (
-        prefixes.get("noun_class", []) + 
-        prefixes.get("verb", []) + 
+        prefixes.get("noun_class", []) +
+        prefixes.get("verb", []) +
         ["ne-", "na-", "ku-", "kwa-", "wa-", "la-", "lo-", "le-"] # Common Zulu/Setswana conjunctions/prepositions
     )
-    
-    for prefix in sorted(all_prefixes, key=len, reverse=True):
-        prefix_clean = prefix.rstrip('-')
-        if token_lower.startswith(prefix_clean):
-            # Ensure we don't strip the entire word
-            if len(token_lower) > len(prefix_clean):
-                return prefix_clean, token_lower[len(prefix_clean):]
-    
+    trie = {}
+    for prefix in all_prefixes:
+        node = trie
+        for c in prefix.rstrip('-'):
+            node = node.setdefault(c, {})
+        node['$'] = True
+    return trie
+
+
+# Per-language prefix tries; identify_prefix used to sort the prefix list
+# by length and run startswith per prefix on every single token
+_PREFIX_TRIE = {lang: _build_prefix_trie(lang) for lang in PREFIXES}
+
+
+@lru_cache(maxsize=65536)
+def identify_prefix(token: str, language: str) -> Tuple[Optional[str], str]:
+    """Identify noun-class or verb prefix in a token. Cached alongside stem:
+    direct callers skip even the trie walk for repeated tokens."""
+    token_lower = token.lower()
+    trie = _PREFIX_TRIE.get(language)
+    if trie is None:
+        return None, token_lower
+
+    # Walk the trie once, remembering the deepest prefix that still leaves
+    # a non-empty remainder — longest-match without any sorting
+    best = 0
+    node = trie
+    limit = len(token_lower) - 1
+    for i, c in enumerate(token_lower):
+        node = node.get(c)
+        if node is None:
+            break
+        if '$' in node and i < limit:
+            best = i + 1
+
+    if best:
+        return token_lower[:best], token_lower[best:]
     return None, token_lower
 
 
+@lru_cache(maxsize=65536)
 def stem(token: str, language: str) -> Tuple[str, str]:
-    """Reduce word to stem for matching."""
+    """Reduce word to stem for matching. Cached: the same tokens recur
+    constantly across a batch, so repeat calls become a dict lookup."""
     prefix, remainder = identify_prefix(token, language)
     return remainder, token
 
 
+def _build_stem_tables(language: str) -> Tuple[Dict[str, Tuple[str, str, str]], Dict[str, str]]:
+    """Build the flat stem -> metadata lookup tables for one language."""
+    # Titles first so nouns take precedence on a stem collision, matching
+    # the old noun-before-title lookup order
+    subject_stems = {}
+    for gender in ["male", "female"]:
+        for title in TITLES.get(language, {}).get(gender, []):
+            s, _ = stem(title, language)
+            subject_stems[s] = (gender, title, "title")
+    for gender in ["male", "female"]:
+        for word, meaning in GENDERED_NOUNS.get(language, {}).get(gender, {}).items():
+            s, _ = stem(word, language)
+            subject_stems[s] = (gender, meaning, "noun")
+
+    pej_stems = {}
+    for p in PEJORATIVE_TERMS.get(language, []):
+        s, _ = stem(p, language)
+        pej_stems[s] = p
+
+    return subject_stems, pej_stems
+
+
+# Lexicon stem tables, built once at import. The lexicons never change at
+# runtime, so rebuilding these dicts on every call was pure allocator churn.
+# Nouns and titles share one flat table, so matching a token is a single
+# dict probe on its stem.
+_SUBJECT_STEMS: Dict[str, Dict[str, Tuple[str, str, str]]] = {}
+_PEJ_STEMS: Dict[str, Dict[str, str]] = {}
+for _language in GENDERED_NOUNS:
+    _SUBJECT_STEMS[_language], _PEJ_STEMS[_language] = _build_stem_tables(_language)
+del _language
+
+
+# Marker token sets and noun substring scanners for detect_language. The
+# short grammatical markers are matched as whole tokens via one set
+# intersection. The gendered nouns must stay substring matches: both
+# languages — isiZulu especially — fuse prefixes onto them
+# ("nabesifazane", "kowesifazane"), so an exact-token test misses almost
+# every inflected occurrence. One unanchored trie-factored lookahead per
+# language finds every noun occurrence in a single scan.
+_SETSWANA_MARKERS = ["ke", "ba", "o a", "ga", "le", "ka", "mo", "wa", "fa", "kgotsa", "gore", "fela"]
+_ZULU_MARKERS = ["ngi", "u", "ba", "uma", "ukuthi", "futhi", "kodwa", "noma", "yini", "kanjani"]
+_TN_MARKER_SET = frozenset(m for m in _SETSWANA_MARKERS if " " not in m)
+_TN_MARKER_MULTI = tuple(m for m in _SETSWANA_MARKERS if " " in m)
+_ZU_MARKER_SET = frozenset(m for m in _ZULU_MARKERS if " " not in m)
+_ZU_MARKER_MULTI = tuple(m for m in _ZULU_MARKERS if " " in m)
+_TN_NOUN_SET = frozenset(GENDERED_NOUNS["setswana"]["male"]) | frozenset(GENDERED_NOUNS["setswana"]["female"])
+_ZU_NOUN_SET = frozenset(GENDERED_NOUNS["isizulu"]["male"]) | frozenset(GENDERED_NOUNS["isizulu"]["female"])
+_TN_NOUN_RE = re.compile(r'(?=(' + _trie_pattern(sorted(_TN_NOUN_SET)) + r'))')
+_ZU_NOUN_RE = re.compile(r'(?=(' + _trie_pattern(sorted(_ZU_NOUN_SET)) + r'))')
+
+
+def _noun_containment(nouns) -> Dict[str, frozenset]:
+    """Map each noun to the other nouns it contains as substrings.
+
+    The lookahead scan captures the longest noun starting at each
+    position; when one noun is a prefix of another ('morwa' inside
+    'morwadi'), the shorter one is implied by the longer hit and must
+    still count, matching the per-noun substring test this replaces.
+    """
+    return {
+        w: contained
+        for w in nouns
+        if (contained := frozenset(o for o in nouns if o != w and o in w))
+    }
+
+
+_TN_NOUN_CONTAINS = _noun_containment(_TN_NOUN_SET)
+_ZU_NOUN_CONTAINS = _noun_containment(_ZU_NOUN_SET)
+
+
+def _noun_score(text_lower: str, pattern: re.Pattern, contains: Dict[str, frozenset]) -> int:
+    """Score distinct gendered nouns present anywhere in the text."""
+    found = {m.group(1) for m in pattern.finditer(text_lower)}
+    for w in tuple(found):
+        implied = contains.get(w)
+        if implied:
+            found |= implied
+    return 2 * len(found)
+
+
+@lru_cache(maxsize=8192)
 def detect_language(text: str) -> str:
     """Auto-detect whether text is Setswana or isiZulu."""
     text_lower = text.lower()
-    
-    setswana_markers = ["ke", "ba", "o a", "ga", "le", "ka", "mo", "wa", "fa", "kgotsa", "gore", "fela"]
-    zulu_markers = ["ngi", "u", "ba", "uma", "ukuthi", "futhi", "kodwa", "noma", "yini", "kanjani"]
-    
-    setswana_score = sum(1 for m in setswana_markers if f" {m} " in f" {text_lower} " or text_lower.startswith(m + " "))
-    zulu_score = sum(1 for m in zulu_markers if f" {m} " in f" {text_lower} " or text_lower.startswith(m + " "))
-    
-    for word in GENDERED_NOUNS["setswana"]["male"].keys():
-        if word in text_lower:
-            setswana_score += 2
-    for word in GENDERED_NOUNS["setswana"]["female"].keys():
-        if word in text_lower:
-            setswana_score += 2
-    for word in GENDERED_NOUNS["isizulu"]["male"].keys():
-        if word in text_lower:
-            zulu_score += 2
-    for word in GENDERED_NOUNS["isizulu"]["female"].keys():
-        if word in text_lower:
-            zulu_score += 2
-    
+    tokens = frozenset(_WORD_RE.findall(text_lower))
+
+    setswana_score = len(tokens & _TN_MARKER_SET) + _noun_score(text_lower, _TN_NOUN_RE, _TN_NOUN_CONTAINS)
+    zulu_score = len(tokens & _ZU_MARKER_SET) + _noun_score(text_lower, _ZU_NOUN_RE, _ZU_NOUN_CONTAINS)
+
+    # Multi-word markers can't live in a token set; the few of them keep
+    # the padded substring test
+    padded = f" {text_lower} "
+    for m in _TN_MARKER_MULTI:
+        if f" {m} " in padded:
+            setswana_score += 1
+    for m in _ZU_MARKER_MULTI:
+        if f" {m} " in padded:
+            zulu_score += 1
+
     return "isizulu" if zulu_score > setswana_score else "setswana"
 
 
-def find_gendered_subject(text: str, language: str) -> List[Dict[str, Any]]:
-    """Find gendered subjects and titles in the text using stem-based matching."""
+@lru_cache(maxsize=1024)
+def _subjects_cached(text: str, language: str) -> Tuple[Dict[str, Any], ...]:
+    """Scan for gendered subjects; memoized since the rewriter pipeline asks
+    for the same text's subjects more than once per document."""
     text_lower = text.lower()
-    tokens = tokenize(text_lower)
     subjects = []
-    lang_nouns = GENDERED_NOUNS.get(language, {})
-    lang_titles = TITLES.get(language, {})
-    
-    # Pre-calculate stems for nouns and titles
-    noun_stems = {}
-    for gender in ["male", "female"]:
-        for word, meaning in lang_nouns.get(gender, {}).items():
-            s, _ = stem(word, language)
-            noun_stems[s] = {"word": word, "gender": gender, "meaning": meaning}
-            
-    title_stems = {}
-    for gender in ["male", "female"]:
-        for title in lang_titles.get(gender, []):
-            s, _ = stem(title, language)
-            title_stems[s] = {"word": title, "gender": gender}
+    subject_stems = _SUBJECT_STEMS.get(language, {})
+
+    # Single linear pass: the token match carries its own offset, so no
+    # str.find() recovery scan per token is needed. Stems are cached, so
+    # matching a token is one dict probe on the flat table.
+    for m in _WORD_RE.finditer(text_lower):
+        token = m.group()
+        pos = m.start()
 
-    # Match tokens against stems
-    current_pos = 0
-    for token in tokens:
-        pos = text_lower.find(token, current_pos)
-        current_pos = pos + len(token)
-        
         s, _ = stem(token, language)
-        
-        if s in noun_stems:
-            subjects.append({
-                "word": token,
-                "gender": noun_stems[s]["gender"],
-                "position": pos,
-                "original": text[pos:pos+len(token)],
-                "meaning": noun_stems[s]["meaning"],
-                "type": "noun"
-            })
-        elif s in title_stems:
+
+        meta = subject_stems.get(s)
+        if meta is not None:
+            gender, meaning, subject_type = meta
             subjects.append({
                 "word": token,
-                "gender": title_stems[s]["gender"],
+                "gender": gender,
                 "position": pos,
                 "original": text[pos:pos+len(token)],
-                "meaning": title_stems[s]["word"],
-                "type": "title"
+                "meaning": meaning,
+                "type": subject_type
             })
-    
-    return sorted(subjects, key=lambda x: x["position"])
 
+    # finditer yields matches left to right, so subjects arrive presorted
+    return tuple(subjects)
 
-def find_stereotyped_actions(text: str, language: str) -> List[Dict[str, Any]]:
-    """Find stereotyped actions/verbs in the text."""
+
+def find_gendered_subject(text: str, language: str) -> List[Dict[str, Any]]:
+    """Find gendered subjects and titles in the text using stem-based matching."""
+    # Copy the cached dicts so callers can mutate their results safely
+    return [dict(s) for s in _subjects_cached(text, language)]
+
+
+@lru_cache(maxsize=1024)
+def _actions_cached(text: str, language: str) -> Tuple[Dict[str, Any], ...]:
+    """Scan for stereotyped actions; memoized like _subjects_cached."""
     text_lower = text.lower()
     actions = []
-    
-    for category, lang_actions in STEREOTYPED_ACTIONS.items():
-        for phrase in lang_actions.get(language, []):
-            pattern = r'\b' + re.escape(phrase) + r'\b'
-            for match in re.finditer(pattern, text_lower):
-                actions.append({
-                    "phrase": phrase,
-                    "category": category,
-                    "position": match.start(),
-                })
-    
-    return sorted(actions, key=lambda x: x["position"])
+
+    pattern = _ACTION_RE.get(language)
+    if pattern is None:
+        return actions
+
+    category_of = _ACTION_CATEGORY[language]
+    for match in pattern.finditer(text_lower):
+        phrase = match.group()
+        actions.append({
+            "phrase": phrase,
+            "category": category_of[phrase],
+            "position": match.start(),
+        })
+
+    # Single-alternation finditer emits hits in position order already
+    return tuple(actions)
+
+
+def find_stereotyped_actions(text: str, language: str) -> List[Dict[str, Any]]:
+    """Find stereotyped actions/verbs in the text."""
+    return [dict(a) for a in _actions_cached(text, language)]
 
 
 # =============================================================================
 # SECTION 3: DETECTION RULES
 # =============================================================================
 
-def rule_1_subject_stereotype_match(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_1_subject_stereotype_match(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 1: Subject-Stereotype Match"""
     explanations = []
-    subjects = find_gendered_subject(text, language)
-    actions = find_stereotyped_actions(text, language)
-    
+
+    if not subjects or not actions:
+        return explanations
+
+    # Actions are position-sorted, so bisect to the first action after each
+    # subject instead of testing every (subject, action) pair.
+    action_positions = [a["position"] for a in actions]
+
     for subject in subjects:
-        for action in actions:
-            if action["position"] > subject["position"]:
-                is_domestic = action["category"] == "domestic"
-                is_academic = action["category"] == "academic_leadership"
-                
-                reason = None
-                if subject["gender"] == "female" and is_domestic:
-                    reason = "Female subject assigned domestic work."
-                elif subject["gender"] == "male" and is_academic:
-                    reason = "Male subject assigned intellectual/leadership work."
-                
-                if reason:
-                    explanations.append({
-                        "span": f"{subject['original']} ... {action['phrase']}",
-                        "rule_triggered": "Subject–Stereotype Match",
-                        "reason": reason
-                    })
-    
+        start = bisect.bisect_right(action_positions, subject["position"])
+        for action in actions[start:]:
+            is_domestic = action["category"] == "domestic"
+            is_academic = action["category"] == "academic_leadership"
+
+            reason = None
+            if subject["gender"] == "female" and is_domestic:
+                reason = "Female subject assigned domestic work."
+            elif subject["gender"] == "male" and is_academic:
+                reason = "Male subject assigned intellectual/leadership work."
+
+            if reason:
+                explanations.append({
+                    "span": f"{subject['original']} ... {action['phrase']}",
+                    "rule_triggered": "Subject–Stereotype Match",
+                    "reason": reason
+                })
+
     return explanations
 
 
-def rule_2_contrastive_gender_roles(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_2_contrastive_gender_roles(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 2: Contrastive Gender Roles"""
     explanations = []
-    text_lower = text.lower()
-    
-    conjunctions = CONTRASTIVE_CONJUNCTIONS.get(language, [])
-    subjects = find_gendered_subject(text, language)
-    actions = find_stereotyped_actions(text, language)
-    
+
+    # Needs both genders among the subjects and at least two actions;
+    # anything less can never fire
+    if not subjects or len(actions) < 2:
+        return explanations
+
+    # Most texts contain no contrastive conjunction; check that with one
+    # search before paying for the assignment pass
+    conj_re = _CONJ_RE.get(language)
+    conj_match = conj_re.search(text_lower) if conj_re is not None else None
+    if conj_match is None:
+        return explanations
+
     male_subjects = [s for s in subjects if s["gender"] == "male"]
     female_subjects = [s for s in subjects if s["gender"] == "female"]
-    
+
     if male_subjects and female_subjects and len(actions) >= 2:
-        for conj in conjunctions:
-            if f" {conj} " in f" {text_lower} ":
-                female_actions = []
-                male_actions = []
-                
-                for action in actions:
-                    closest_subject = None
-                    closest_dist = float('inf')
-                    for s in subjects:
-                        dist = action["position"] - s["position"]
-                        if 0 < dist < closest_dist:
-                            closest_dist = dist
-                            closest_subject = s
-                    
-                    if closest_subject:
-                        if closest_subject["gender"] == "female":
-                            female_actions.append(action)
-                        else:
-                            male_actions.append(action)
-                
-                female_domestic = any(a["category"] == "domestic" for a in female_actions)
-                male_academic = any(a["category"] == "academic_leadership" for a in male_actions)
-                
-                if female_domestic and male_academic:
-                    explanations.append({
-                        "span": f"{female_subjects[0]['original']} ... {conj} ... {male_subjects[0]['original']}",
-                        "rule_triggered": "Contrastive Gender Roles",
-                        "reason": "Female subject assigned domestic work while male subject assigned academic/leadership work."
-                    })
-                    break
-    
+        # Subjects are position-sorted; the closest preceding subject for an
+        # action is found with one bisect instead of a scan over all subjects.
+        # The gender/action assignment doesn't depend on which conjunction
+        # matched, so it is computed once rather than per conjunction.
+        subject_positions = [s["position"] for s in subjects]
+
+        female_domestic = False
+        male_academic = False
+        for action in actions:
+            idx = bisect.bisect_left(subject_positions, action["position"]) - 1
+            if idx < 0:
+                continue
+            if subjects[idx]["gender"] == "female":
+                if action["category"] == "domestic":
+                    female_domestic = True
+            elif action["category"] == "academic_leadership":
+                male_academic = True
+
+        if female_domestic and male_academic:
+            explanations.append({
+                "span": f"{female_subjects[0]['original']} ... {conj_match.group(0)} ... {male_subjects[0]['original']}",
+                "rule_triggered": "Contrastive Gender Roles",
+                "reason": "Female subject assigned domestic work while male subject assigned academic/leadership work."
+            })
+
     return explanations
 
 
-def rule_3_unnecessary_gender_marking(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_3_unnecessary_gender_marking(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 3: Unnecessary Gender Marking"""
     explanations = []
-    text_lower = text.lower()
     
     occupations = OCCUPATIONS.get(language, {})
     gendered_forms = occupations.get("gendered_forms", {})
-    
+    pattern = _GENDERED_FORM_RE.get(language)
+    if not gendered_forms or pattern is None:
+        return explanations
+
+    # Cheap first-character probe before the full alternation scan; most
+    # texts contain no gendered occupation form at all
+    first_chars = _RULE3_FIRST[language]
+    if not any(c in first_chars for c in text_lower):
+        return explanations
+
+    found = {m.group(1) for m in pattern.finditer(text_lower)}
+
     for gendered, neutral in gendered_forms.items():
-        if gendered in text_lower:
+        if gendered in found:
             explanations.append({
                 "span": gendered,
                 "rule_triggered": "Unnecessary Gender Marking",
                 "reason": f"Occupation '{gendered}' unnecessarily marked with gender. Use neutral form '{neutral}' instead."
             })
-    
+
     return explanations
 
 
-def rule_4_generalizations(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_4_generalizations(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 4: Generalizations"""
     explanations = []
-    text_lower = text.lower()
-    
-    subjects = find_gendered_subject(text, language)
-    markers = GENERALIZATION_MARKERS.get(language, [])
-    
+
+    # Without a gendered subject there is nothing to generalize about;
+    # skip the marker scans entirely
+    if not subjects:
+        return explanations
+
+    # Each subject word came out of this text, so the old
+    # '\bword\b.*\bmarker\b|\bmarker\b.*\bword\b' pattern reduced to "is
+    # the marker present" — test each marker once instead of per pair
+    found = [marker for marker, pat in _GEN_MARKER_RES.get(language, ())
+             if pat.search(text_lower)]
+    if not found:
+        return explanations
+
     for subject in subjects:
-        for marker in markers:
-            pattern = rf'\b{re.escape(subject["word"])}\b.*\b{re.escape(marker)}\b|\b{re.escape(marker)}\b.*\b{re.escape(subject["word"])}\b'
-            if re.search(pattern, text_lower):
-                explanations.append({
-                    "span": f"{subject['original']} ... {marker}",
-                    "rule_triggered": "Generalization",
-                    "reason": f"Making generalized claim about {subject['gender']}s using '{marker}'."
-                })
-    
+        for marker in found:
+            explanations.append({
+                "span": f"{subject['original']} ... {marker}",
+                "rule_triggered": "Generalization",
+                "reason": f"Making generalized claim about {subject['gender']}s using '{marker}'."
+            })
+
     return explanations
 
 
-def rule_5_diminutives(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_5_diminutives(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 5: Diminutives or Infantilizing Terms"""
     explanations = []
-    text_lower = text.lower()
-    patterns = INFANTILIZING_PATTERNS.get(language, [])
-    
+    patterns = _COMPILED_INFANTILIZING.get(language, [])
+
     for pattern in patterns:
-        match = re.search(pattern, text_lower)
+        match = pattern.search(text_lower)
         if match:
             explanations.append({
                 "span": match.group(),
@@ -562,12 +857,13 @@ def rule_5_diminutives(text: str, language: str) -> List[Dict[str, Any]]:
     return explanations
 
 
-def rule_6_asymmetrical_ordering(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_6_asymmetrical_ordering(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 6: Asymmetrical Ordering (Male Firstness)"""
     explanations = []
-    text_lower = text.lower()
-    subjects = find_gendered_subject(text, language)
-    
+
+    if len(subjects) < 2:
+        return explanations
+
     # Look for patterns like "male and female" or "male, female"
     for i in range(len(subjects) - 1):
         s1 = subjects[i]
@@ -585,67 +881,60 @@ def rule_6_asymmetrical_ordering(text: str, language: str) -> List[Dict[str, Any
     return explanations
 
 
-def rule_7_pejorative_association(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_7_pejorative_association(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 7: Pejorative Association (Stem-based)"""
     explanations = []
-    text_lower = text.lower()
-    tokens = tokenize(text_lower)
-    subjects = find_gendered_subject(text, language)
-    pejorative_list = PEJORATIVE_TERMS.get(language, [])
-    
-    # Pre-calculate pejorative stems
-    pej_stems = {}
-    for p in pejorative_list:
-        s, _ = stem(p, language)
-        pej_stems[s] = p
 
-    # Find pejoratives in tokens
+    # The association needs a gendered subject; don't stem every token
+    # in the text just to throw the pejoratives away
+    if not subjects:
+        return explanations
+
+    pej_stems = _PEJ_STEMS.get(language, {})
+
+    # Find pejoratives in one scan; the tokenizer match carries the position,
+    # so no str.find() recovery pass is needed
     found_pejoratives = []
-    current_pos = 0
-    for token in tokens:
-        pos = text_lower.find(token, current_pos)
-        current_pos = pos + len(token)
+    for m in _WORD_RE.finditer(text_lower):
+        token = m.group()
         s, _ = stem(token, language)
         if s in pej_stems:
-            found_pejoratives.append({"word": token, "stem": s, "pos": pos})
+            found_pejoratives.append({"word": token, "stem": s, "pos": m.start()})
+
+    # Pejoratives come out of the scan position-sorted, so the "within 40
+    # chars" window for each subject is a bisect range, not a full pass
+    pej_positions = [p["pos"] for p in found_pejoratives]
 
     for subject in subjects:
-        for pej in found_pejoratives:
-            # Check if pejorative is near the subject (within 40 chars)
-            if abs(subject["position"] - pej["pos"]) < 40:
-                explanations.append({
-                    "span": text[min(subject["position"], pej["pos"]):max(subject["position"]+len(subject["word"]), pej["pos"]+len(pej["word"]))],
-                    "rule_triggered": "Pejorative Association",
-                    "reason": f"Gendered subject '{subject['word']}' associated with pejorative term '{pej['word']}'."
-                })
-    
+        lo = bisect.bisect_left(pej_positions, subject["position"] - 39)
+        hi = bisect.bisect_right(pej_positions, subject["position"] + 39)
+        for pej in found_pejoratives[lo:hi]:
+            explanations.append({
+                "span": text[min(subject["position"], pej["pos"]):max(subject["position"]+len(subject["word"]), pej["pos"]+len(pej["word"]))],
+                "rule_triggered": "Pejorative Association",
+                "reason": f"Gendered subject '{subject['word']}' associated with pejorative term '{pej['word']}'."
+            })
+
     return explanations
 
 
-def rule_8_translation_bias(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_8_translation_bias(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 8: Translation Bias (Gendered pronouns for neutral terms)"""
     # This rule requires the English translation, which isn't always available in 'analyze'
     # For now, we'll skip it or implement it if we can pass the translation
     return []
 
 
-def rule_9_named_entity_bias(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_9_named_entity_bias(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 9: Named Entity Bias"""
     explanations = []
-    text_lower = text.lower()
-    
-    # Common names associated with stereotypes in the dataset
-    biased_names = {
-        "thandi": "female",
-        "lerato": "female",
-        "palesa": "female",
-        "thabo": "male",
-        "mpho": "male",
-        "kabelo": "male"
-    }
-    
-    for name, gender in biased_names.items():
-        if name in text_lower:
+
+    found_names = {m.group() for m in _BIASED_NAMES_RE.finditer(text_lower)}
+    if not found_names:
+        return explanations
+
+    for name, gender in _BIASED_NAMES.items():
+        if name in found_names:
             # Check if associated with a stereotyped action
             lang_actions = STEREOTYPED_ACTIONS.get(language, {}).get(gender, {})
             for action in lang_actions:
@@ -658,10 +947,9 @@ def rule_9_named_entity_bias(text: str, language: str) -> List[Dict[str, Any]]:
     
     return explanations
 
-def rule_10_stereotypical_pronominalization(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_10_stereotypical_pronominalization(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 10: Stereotypical Pronominalization (New)"""
     explanations = []
-    text_lower = text.lower()
     
     # Use terms from rag_data
     terms = rag_data.PRONOMINALIZATION_TERMS
@@ -677,15 +965,12 @@ def rule_10_stereotypical_pronominalization(text: str, language: str) -> List[Di
                 
     return explanations
 
-def rule_11_implicit_bias(text: str, language: str) -> List[Dict[str, Any]]:
+def rule_11_implicit_bias(text: str, text_lower: str, language: str, subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Rule 11: Implicit Bias (New)"""
     explanations = []
-    text_lower = text.lower()
-    
-    patterns = rag_data.BIAS_PATTERNS.get("capability_assumptions", [])
     
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _CAPABILITY_RES:
+        match = pattern.search(text_lower)
         if match:
             explanations.append({
                 "span": match.group(),
@@ -711,72 +996,67 @@ def template_a_inclusive_reframe(text: str, language: str, female_subject: str,
 
 def template_b_neutral_replacement(text: str, language: str) -> str:
     """Template B: Neutral-term Replacement"""
-    result = text
-    lang_nouns = GENDERED_NOUNS.get(language, {})
-    neutral = NEUTRAL_TERMS.get(language, {})
-    all_gendered = {**lang_nouns.get("male", {}), **lang_nouns.get("female", {})}
-    
-    for gendered, meaning in all_gendered.items():
-        pattern = r'\b' + re.escape(gendered) + r'\b'
-        result = re.sub(pattern, neutral["singular"], result, flags=re.IGNORECASE)
-    
-    return result
+    pattern = _NEUTRAL_SUB_RE.get(language)
+    neutral = NEUTRAL_TERMS.get(language)
+    if pattern is None or neutral is None:
+        return text
+    return pattern.sub(neutral["singular"], text)
 
 
 def template_c_remove_gender_marking(text: str, language: str) -> str:
     """Template C: Remove Gender Marking from Occupations"""
-    result = text
-    occupations = OCCUPATIONS.get(language, {})
-    gendered_forms = occupations.get("gendered_forms", {})
-    
-    for gendered, neutral in gendered_forms.items():
-        pattern = r'\b' + re.escape(gendered) + r'\b'
-        result = re.sub(pattern, neutral, result, flags=re.IGNORECASE)
-    
-    return result
+    pattern = _OCC_SUB_RE.get(language)
+    if pattern is None:
+        return text
+    mapping = _OCC_SUB_MAP[language]
+    return pattern.sub(lambda m: mapping[m.group(1).lower()], text)
 
 
 def template_d_pluralization(text: str, language: str) -> str:
     """Template D: Pluralization for Neutral Pronouns"""
     result = text
     if language == "setswana":
-        result = re.sub(r'\bo\s+a\s+', 'ba a ', result)
-        result = re.sub(r'\bo\s+', 'ba ', result)
+        result = _PLURAL_TN_OA_RE.sub('ba a ', result)
+        result = _PLURAL_TN_O_RE.sub('ba ', result)
     else:
-        result = re.sub(r'\bu\s+', 'ba ', result)
+        result = _PLURAL_ZU_U_RE.sub('ba ', result)
     return result
 
 
 def template_e_everyone_pronoun(text: str, language: str) -> str:
     """Template E: Both-Gender or Neutral Pronouns"""
-    result = text
     neutral = NEUTRAL_TERMS.get(language, {})
-    lang_nouns = GENDERED_NOUNS.get(language, {})
-    all_gendered = list(lang_nouns.get("male", {}).keys()) + list(lang_nouns.get("female", {}).keys())
-    
-    for gendered in all_gendered:
-        pattern = r'\b' + re.escape(gendered) + r'\b'
-        if re.search(pattern, result, flags=re.IGNORECASE):
-            result = re.sub(pattern, neutral["everyone"], result, flags=re.IGNORECASE)
-            break
-    
-    return result
+    pattern = _NEUTRAL_SUB_RE.get(language)
+    if pattern is None or not neutral:
+        return text
+
+    # One alternation pass finds every gendered word present; the first one
+    # in lexicon order is the one replaced, as before
+    present = {m.group(0).lower() for m in pattern.finditer(text)}
+    if not present:
+        return text
+
+    word_res = _GENDERED_WORD_RES[language]
+    for gendered in _ALL_GENDERED[language]:
+        if gendered in present:
+            return word_res[gendered].sub(neutral["everyone"], text)
+
+    return text
 
 
 # =============================================================================
 # SECTION 5: REWRITER
 # =============================================================================
 
-def generate_rewrite(text: str, language: str, explanations: List[Dict[str, Any]]) -> str:
+def generate_rewrite(text: str, language: str, explanations: List[Dict[str, Any]], subjects: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> str:
     """Generate a rewritten version based on detected biases."""
     if not explanations:
         return text
     
     rewritten = text
-    rules_triggered = [e["rule_triggered"] for e in explanations]
+    # Set instead of list: the dispatch below is all membership tests
+    rules_triggered = {e["rule_triggered"] for e in explanations}
     
-    subjects = find_gendered_subject(text, language)
-    actions = find_stereotyped_actions(text, language)
     
     male_subjects = [s for s in subjects if s["gender"] == "male"]
     female_subjects = [s for s in subjects if s["gender"] == "female"]
@@ -804,15 +1084,27 @@ def generate_rewrite(text: str, language: str, explanations: List[Dict[str, Any]
         if len(male_subjects) >= 1 and len(female_subjects) >= 1:
             m_subj = male_subjects[0]
             f_subj = female_subjects[0]
-            if m_subj["position"] < f_subj["position"]:
-                # This is a very basic swap, might need more logic for complex sentences
-                rewritten = text.replace(m_subj["original"], "TEMP_M").replace(f_subj["original"], m_subj["original"]).replace("TEMP_M", f_subj["original"])
+            m_pos, m_word = m_subj["position"], m_subj["original"]
+            f_pos, f_word = f_subj["position"], f_subj["original"]
+            if m_pos < f_pos:
+                if f_pos >= m_pos + len(m_word):
+                    # Splice the two subjects at their known positions — one
+                    # pass, no sentinel token, and other occurrences of the
+                    # same words elsewhere in the text are left alone.
+                    rewritten = (
+                        text[:m_pos] + f_word
+                        + text[m_pos + len(m_word):f_pos] + m_word
+                        + text[f_pos + len(f_word):]
+                    )
+                else:
+                    # Overlapping spans: fall back to neutral replacement
+                    rewritten = template_b_neutral_replacement(text, language)
     elif "Pejorative Association" in rules_triggered:
         rewritten = template_b_neutral_replacement(text, language)
-        # Also remove pejorative terms
-        pejoratives = PEJORATIVE_TERMS.get(language, [])
-        for p in pejoratives:
-            rewritten = re.sub(r'\b' + re.escape(p) + r'\b', '', rewritten, flags=re.IGNORECASE).strip()
+        # Also remove pejorative terms, all in one substitution pass
+        pej_re = _PEJ_REMOVE_RE.get(language)
+        if pej_re is not None:
+            rewritten = pej_re.sub('', rewritten).strip()
     elif "Named Entity Bias" in rules_triggered:
         # For named entity bias, we try to use a neutral description or just keep the name but neutralize the context
         rewritten = template_b_neutral_replacement(text, language)
@@ -834,24 +1126,54 @@ def generate_rewrite(text: str, language: str, explanations: List[Dict[str, Any]
 # SECTION 6: MAIN PIPELINE
 # =============================================================================
 
-def analyze(text: str, language: Optional[str] = None, show_progress: bool = False) -> Dict[str, Any]:
-    """
-    Main analysis function with optional progress display.
-    """
-    stages = [
-        "Language Detection",
-        "Preprocessing & Tokenization", 
-        "Subject & Action Scanning",
-        "Rule Application",
-        "Rewrite Generation"
-    ]
-    
+# The stage names and rule order never change between calls, so they live
+# here as tuples instead of being rebuilt inside every analyze() invocation.
+_STAGES = (
+    "Language Detection",
+    "Preprocessing & Tokenization",
+    "Subject & Action Scanning",
+    "Rule Application",
+    "Rewrite Generation",
+)
+
+_RULES = (
+    rule_1_subject_stereotype_match,
+    rule_2_contrastive_gender_roles,
+    rule_3_unnecessary_gender_marking,
+    rule_4_generalizations,
+    rule_5_diminutives,
+    rule_6_asymmetrical_ordering,
+    rule_7_pejorative_association,
+    rule_8_translation_bias,
+    rule_9_named_entity_bias,
+    rule_10_stereotypical_pronominalization, # New
+    rule_11_implicit_bias # New
+)
+
+# Rules 1, 2, 4, 6 and 7 need a subject or an action to fire; with both
+# scans empty only these lexicon-driven rules can match
+_LEXICON_RULES = (
+    rule_3_unnecessary_gender_marking,
+    rule_5_diminutives,
+    rule_9_named_entity_bias,
+    rule_10_stereotypical_pronominalization,
+    rule_11_implicit_bias,
+)
+
+
+def _analyze_impl(text: str, language: Optional[str], show_progress: bool) -> Dict[str, Any]:
+    """Run the full detection pipeline. See analyze()."""
+    stages = _STAGES
+
     if show_progress:
         show_stage_progress(stages, 0)
         
     # Stage 1: Language Detection
     if not language:
         language = detect_language(text)
+
+    # Lowercase once here; every rule shares it instead of re-lowering
+    text_lower = text.lower()
     
     if show_progress:
         show_stage_progress(stages, 1)
@@ -862,51 +1184,48 @@ def analyze(text: str, language: Optional[str] = None, show_progress: bool = Fal
     if show_progress:
         show_stage_progress(stages, 2)
         
-    # Stage 3: Scanning
-    subjects = find_gendered_subject(text, language)
-    actions = find_stereotyped_actions(text, language)
-    
+    # Stage 3: Scanning — once per document; rules and the rewrite all
+    # share these results instead of rescanning the text themselves.
+    # The cached tuples are used directly: rules only read them.
+    subjects = list(_subjects_cached(text, language))
+    actions = list(_actions_cached(text, language))
+
     if show_progress:
         show_stage_progress(stages, 3)
         
     # Stage 4: Rule Application
     explanations = []
-    
-    rules = [
-        rule_1_subject_stereotype_match,
-        rule_2_contrastive_gender_roles,
-        rule_3_unnecessary_gender_marking,
-        rule_4_generalizations,
-        rule_5_diminutives,
-        rule_6_asymmetrical_ordering,
-        rule_7_pejorative_association,
-        rule_8_translation_bias,
-        rule_9_named_entity_bias,
-        rule_10_stereotypical_pronominalization, # New
-        rule_11_implicit_bias # New
-    ]
-    
+    seen = set()
+
+    rules = _RULES if subjects or actions else _LEXICON_RULES
+
     if show_progress:
         pb = ProgressBar(len(rules), "Applying Rules")
     
     for i, rule in enumerate(rules):
         try:
-            result = rule(text, language)
-            if result:
-                explanations.extend(result)
-        except Exception as e:
-            # Fail gracefully on individual rules
+            result = rule(text, text_lower, language, subjects, actions)
+            # Dedupe on insert; rules scanning overlapping spans can emit
+            # the same finding more than once
+            for exp in result:
+                key = (exp["span"], exp["rule_triggered"], exp["reason"])
+                if key not in seen:
+                    seen.add(key)
+                    explanations.append(exp)
+        except (KeyError, IndexError, re.error):
+            # Fail gracefully on individual rules: lexicon/offset lookups
+            # are the only failure modes worth swallowing. Anything else
+            # is a real bug and should surface instead of being hidden.
             pass
         if show_progress:
             pb.update()
-            time.sleep(0.05) # Visual delay
-            
+
     if show_progress:
         pb.complete()
         show_stage_progress(stages, 4)
         
     # Stage 5: Rewrite
-    rewrite = generate_rewrite(text, language, explanations)
+    rewrite = generate_rewrite(text, language, explanations, subjects, actions)
     
     return {
         "text": text,
@@ -917,15 +1236,56 @@ def analyze(text: str, language: Optional[str] = None, show_progress: bool = Fal
     }
 
 
+@lru_cache(maxsize=8192)
+def _analyze_cached(text: str, language: Optional[str]) -> Dict[str, Any]:
+    """Memoized full-pipeline run; batch corpora repeat sentences often."""
+    return _analyze_impl(text, language, False)
+
+
+def analyze(text: str, language: Optional[str] = None, show_progress: bool = False) -> Dict[str, Any]:
+    """
+    Main analysis function with optional progress display.
+    """
+    if show_progress:
+        # Progress output is a side effect, so it can't come from the cache
+        return _analyze_impl(text, language, True)
+
+    result = _analyze_cached(text, language)
+    # Copy the envelope and explanation dicts so callers can't mutate the
+    # cached entry
+    return {
+        "text": result["text"],
+        "language": result["language"],
+        "has_bias": result["has_bias"],
+        "explanations": [dict(e) for e in result["explanations"]],
+        "rewrite": result["rewrite"],
+    }
+
+
+# Below this batch size, pool startup costs more than it saves
+_POOL_THRESHOLD = 16
+
+
 def batch_analyze(texts: List[str]) -> List[Dict[str, Any]]:
-    """Analyze a batch of texts."""
+    """Analyze a batch of texts.
+
+    Each text is independent, so larger batches are spread across a
+    multiprocessing.Pool with chunked dispatch to amortize IPC; small
+    batches stay serial to avoid pool startup overhead.
+    """
     results = []
     pb = ProgressBar(len(texts), "Batch Processing")
-    
-    for text in texts:
-        results.append(analyze(text))
-        pb.update()
-        
+
+    if len(texts) >= _POOL_THRESHOLD:
+        with multiprocessing.Pool() as pool:
+            for result in pool.imap(analyze, texts, chunksize=16):
+                results.append(result)
+                pb.update()
+    else:
+        for text in texts:
+            results.append(analyze(text))
+            pb.update()
+
     pb.complete()
     return results
 
@@ -1,13 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
+import io
 import json
-import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_URL = "http://localhost:8080"
 
+# One session for the whole suite so the TCP connection is reused across
+# tests instead of being re-opened per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 def test_health():
     print("\nTesting /health...")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health")
         print(f"Status: {response.status_code}")
         print(f"Response: {response.json()}")
     except Exception as e:
@@ -20,7 +31,7 @@ def test_single_correct():
         "language": "tn"
     }
     try:
-        response = requests.post(f"{BASE_URL}/correct", json=payload)
+        response = SESSION.post(f"{BASE_URL}/correct", json=payload)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
     except Exception as e:
@@ -43,21 +54,19 @@ def test_batch_correct():
         }
     ]
     
-    filename = "temp_test_batch.json"
-    with open(filename, "w") as f:
-        json.dump(batch_data, f)
-    
+    # Upload straight from memory; no temp file on disk to clean up
+    if orjson is not None:
+        buf = io.BytesIO(orjson.dumps(batch_data))
+    else:
+        buf = io.BytesIO(json.dumps(batch_data).encode("utf-8"))
+
     try:
-        with open(filename, "rb") as f:
-            files = {"file": (filename, f, "application/json")}
-            response = requests.post(f"{BASE_URL}/batch-correct", files=files)
-            print(f"Status: {response.status_code}")
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
+        files = {"file": ("batch.json", buf, "application/json")}
+        response = SESSION.post(f"{BASE_URL}/batch-correct", files=files)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {json.dumps(response.json(), indent=2)}")
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        if os.path.exists(filename):
-            os.remove(filename)
 
 if __name__ == "__main__":
     print("Ensure the app is running locally on port 8080 before running this test.")
@@ -10,9 +10,21 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app import app
 
 class TestBiasApp(unittest.TestCase):
-    def setUp(self):
-        self.app = app.test_client()
-        self.app.testing = True
+    # One test client and one encoded batch payload for the whole class;
+    # per-test setUp would rebuild both for every test method
+    BATCH_DATA = [
+        {
+            "id": "test_001",
+            "text": "Mosetsana o apea dijo.",
+            "lang": "tn"
+        }
+    ]
+    BATCH_BYTES = json.dumps(BATCH_DATA).encode('utf-8')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = app.test_client()
+        cls.app.testing = True
 
     def test_index_route(self):
         response = self.app.get('/')
@@ -22,16 +34,8 @@ class TestBiasApp(unittest.TestCase):
         self.assertIn(b'Batch Processing', response.data)
 
     def test_batch_correct(self):
-        batch_data = [
-            {
-                "id": "test_001",
-                "text": "Mosetsana o apea dijo.",
-                "lang": "tn"
-            }
-        ]
-        
         data = {
-            'file': (io.BytesIO(json.dumps(batch_data).encode('utf-8')), 'test.json')
+            'file': (io.BytesIO(self.BATCH_BYTES), 'test.json')
         }
         
         response = self.app.post('/batch-correct', data=data, content_type='multipart/form-data')